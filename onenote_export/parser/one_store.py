@@ -5,8 +5,10 @@ and organizes it by page.
 """
 
 import logging
+import mmap
 import re
 import struct
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -145,8 +147,29 @@ _NUMBER_LIST = "jcidNumberListNode"
 _STYLE_CONTAINER = "jcidPersistablePropertyContainerForTOCSection"
 _REVISION_META = "jcidRevisionMetaData"
 
-
-@dataclass
+# Content types collected into pages
+_CONTENT_TYPES = frozenset(
+    {
+        _RICH_TEXT,
+        _IMAGE_NODE,
+        _TABLE_NODE,
+        _TABLE_ROW,
+        _TABLE_CELL,
+        _EMBEDDED_FILE,
+        _OUTLINE_ELEMENT,
+        _OUTLINE_NODE,
+        _NUMBER_LIST,
+    }
+)
+
+# First run of digits in a string value
+_DIGIT_RE = re.compile(r"\d+")
+
+# Translation table that deletes null bytes
+_NULL_TRANS = str.maketrans("", "", "\x00")
+
+
+@dataclass(slots=True)
 class ExtractedProperty:
     """A single property from a OneNote object."""
 
@@ -154,7 +177,7 @@ class ExtractedProperty:
     value: object  # str, bytes, int, bool, list, etc.
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedObject:
     """A parsed object from the OneNote file."""
 
@@ -163,7 +186,7 @@ class ExtractedObject:
     properties: dict[str, object] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedPage:
     """A page with its title and content objects."""
 
@@ -175,7 +198,7 @@ class ExtractedPage:
     objects: list[ExtractedObject] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedSection:
     """All pages extracted from a single .one file."""
 
@@ -196,12 +219,20 @@ class OneStoreParser:
         """Parse the .one file and return structured content."""
         section = ExtractedSection(file_path=str(self.file_path))
 
-        with open(self.file_path, "rb") as f:
-            doc = OneDocment(f)
+        # Map the file read-only so pyOneNote's many small reads are
+        # served from the page cache instead of buffered file I/O.
+        with (
+            open(self.file_path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf,
+        ):
+            doc = OneDocment(buf)
+
+            # Validate it's a .one file
+            if doc.header.guidFileType != Header.ONE_UUID:
+                raise ValueError(f"{self.file_path} is not a .one file")
 
-        # Validate it's a .one file
-        if doc.header.guidFileType != Header.ONE_UUID:
-            raise ValueError(f"{self.file_path} is not a .one file")
+            # Extract paragraph styles from ReadOnly object declarations
+            section.paragraph_styles = self._extract_paragraph_styles(doc, buf)
 
         # Get all properties (objects with their property sets)
         raw_props = doc.get_properties()
@@ -210,36 +241,46 @@ class OneStoreParser:
         # so that PictureContainer references (which use identity) can
         # resolve to the correct file data.
         raw_files = doc.get_files()
-        for guid, finfo in raw_files.items():
-            content = finfo.get("content", b"")
-            if content:
-                section.file_data[guid] = content
-                identity = finfo.get("identity", "")
-                if identity:
-                    section.file_data[identity] = content
-
-        # Extract paragraph styles from ReadOnly object declarations
-        section.paragraph_styles = self._extract_paragraph_styles(doc)
-
-        # Convert raw properties to ExtractedObjects
+        section.file_data = {
+            key: content
+            for guid, finfo in raw_files.items()
+            if (content := finfo.get("content"))
+            for key in (guid, finfo.get("identity"))
+            if key
+        }
+
+        # Convert raw properties to ExtractedObjects.  pyOneNote builds a
+        # fresh dict per property set and ``doc`` is discarded after this
+        # method, so the dict can be adopted without copying.  JCID type
+        # names are interned so comparisons against the module constants
+        # hit the identity fast path.  The section display name is taken
+        # from the first section metadata object that carries one.
         all_objects = []
+        display_name = ""
         for raw in raw_props:
+            val = raw["val"]
             obj = ExtractedObject(
-                obj_type=raw["type"],
+                obj_type=sys.intern(raw["type"]),
                 identity=raw["identity"],
-                properties=dict(raw["val"]),
+                properties=val if isinstance(val, dict) else dict(val),
             )
             all_objects.append(obj)
 
+            if not display_name and obj.obj_type == _SECTION_META:
+                name = obj.properties.get("SectionDisplayName", "")
+                if name:
+                    display_name = str(name).strip()
+
         # Build page structure
         section.pages = self._build_pages(all_objects)
-        section.display_name = self._extract_section_name(all_objects)
+        section.display_name = display_name
 
         return section
 
     def _extract_paragraph_styles(
         self,
         doc: OneDocment,
+        buf: mmap.mmap,
     ) -> dict[str, str]:
         """Extract paragraph style IDs from ReadOnly object declarations.
 
@@ -248,8 +289,9 @@ class OneStoreParser:
         contain the ``jcidParagraphStyleObjectForText`` property sets.
 
         This method finds those ReadOnly nodes, seeks to their data in
-        the file, parses the PropertySet, and builds a mapping from the
-        object's identity string to its ``ParagraphStyleId`` value.
+        ``buf`` (the mapped .one file), parses the PropertySet, and builds
+        a mapping from the object's identity string to its
+        ``ParagraphStyleId`` value.
         """
         all_nodes: list[object] = []
         OneDocment.traverse_nodes(doc.root_file_node_list, all_nodes, [])
@@ -269,10 +311,9 @@ class OneStoreParser:
                 continue
 
             try:
-                with open(self.file_path, "rb") as f:
-                    f.seek(ref_stp)
-                    prop_set = ObjectSpaceObjectPropSet(f, doc)
-                    props = dict(prop_set.body.get_properties())
+                buf.seek(ref_stp)
+                prop_set = ObjectSpaceObjectPropSet(buf, doc)
+                props = dict(prop_set.body.get_properties())
             except Exception:
                 continue
 
@@ -287,15 +328,6 @@ class OneStoreParser:
 
         return styles
 
-    def _extract_section_name(self, objects: list[ExtractedObject]) -> str:
-        """Extract section display name from section metadata."""
-        for obj in objects:
-            if obj.obj_type == _SECTION_META:
-                name = obj.properties.get("SectionDisplayName", "")
-                if name:
-                    return str(name).strip()
-        return ""
-
     def _build_pages(self, objects: list[ExtractedObject]) -> list[ExtractedPage]:
         """Group objects into pages based on the document structure.
 
@@ -313,81 +345,70 @@ class OneStoreParser:
         """
         pages: list[ExtractedPage] = []
 
-        # Classify every object by type, indexed by GUID
-        guid_objects: dict[str, list[ExtractedObject]] = {}
-        page_metas: list[ExtractedObject] = []
-        page_node_guids: list[str] = []
+        # Classify every object by type in a single pass, indexed by GUID.
+        # Content objects and page nodes are captured here so the
+        # per-page loop below does not have to re-scan any object list.
+        guid_content: dict[str, list[ExtractedObject]] = {}
+        page_metas: list[tuple[str, ExtractedObject]] = []
+        # First page node per GUID, in first-seen order
+        guid_pagenode: dict[str, ExtractedObject] = {}
+        all_content: list[ExtractedObject] = []
+
+        content_types = _CONTENT_TYPES
+        page_meta = _PAGE_META
+        page_node = _PAGE_NODE
+
+        # Revisions repeat identity strings; parse each distinct one once
+        guid_cache: dict[str, str] = {}
+
+        # Bind hot methods once rather than per object
+        extract_guid = _extract_guid
+        cache_get = guid_cache.get
+        content_setdefault = guid_content.setdefault
+        content_append = all_content.append
+        metas_append = page_metas.append
+        pagenode_setdefault = guid_pagenode.setdefault
 
         for obj in objects:
-            guid = _extract_guid(obj.identity)
-            guid_objects.setdefault(guid, []).append(obj)
-
-            if obj.obj_type == _PAGE_META:
-                page_metas.append(obj)
-            elif obj.obj_type == _PAGE_NODE:
-                if guid not in page_node_guids:
-                    page_node_guids.append(guid)
+            identity = obj.identity
+            guid = cache_get(identity)
+            if guid is None:
+                guid = guid_cache[identity] = extract_guid(identity)
+
+            obj_type = obj.obj_type
+            if obj_type in content_types:
+                content_setdefault(guid, []).append(obj)
+                content_append(obj)
+            elif obj_type == page_meta:
+                metas_append((guid, obj))
+            elif obj_type == page_node:
+                pagenode_setdefault(guid, obj)
 
         # No page metadata at all — single unnamed page
         if not page_metas:
-            all_content = [
-                o
-                for o in objects
-                if o.obj_type
-                in (
-                    _RICH_TEXT,
-                    _IMAGE_NODE,
-                    _TABLE_NODE,
-                    _TABLE_ROW,
-                    _TABLE_CELL,
-                    _EMBEDDED_FILE,
-                    _OUTLINE_ELEMENT,
-                    _OUTLINE_NODE,
-                    _NUMBER_LIST,
-                )
-            ]
             if all_content:
                 pages.append(ExtractedPage(objects=all_content))
             return pages
 
-        # Build a lookup: GUID -> page metadata
-        meta_by_guid: dict[str, ExtractedObject] = {}
-        for meta in page_metas:
-            guid = _extract_guid(meta.identity)
-            # Later entries (newer revisions) overwrite earlier ones
-            meta_by_guid[guid] = meta
+        # Build a lookup: GUID -> page metadata.
+        # Later entries (newer revisions) overwrite earlier ones.
+        meta_by_guid: dict[str, ExtractedObject] = dict(page_metas)
 
         # Orphan metas: metadata GUIDs with no page node (old revisions)
         orphan_metas: dict[str, ExtractedObject] = {
-            g: m for g, m in meta_by_guid.items() if g not in page_node_guids
-        }
-
-        # Content types we care about
-        _CONTENT_TYPES = {
-            _RICH_TEXT,
-            _IMAGE_NODE,
-            _TABLE_NODE,
-            _TABLE_ROW,
-            _TABLE_CELL,
-            _EMBEDDED_FILE,
-            _OUTLINE_ELEMENT,
-            _OUTLINE_NODE,
-            _NUMBER_LIST,
+            g: m for g, m in meta_by_guid.items() if g not in guid_pagenode
         }
 
         # Build one page per content GUID (GUID that has a PageNode)
         seen_titles: dict[str, int] = {}
-        for content_guid in page_node_guids:
-            objs = guid_objects.get(content_guid, [])
-
+        for content_guid, pn in guid_pagenode.items():
             # Find metadata — prefer same GUID, fall back to orphan
             meta = meta_by_guid.get(content_guid)
             if not meta:
-                # Match orphan metadata by scanning (first available)
-                for og, om in list(orphan_metas.items()):
-                    meta = om
-                    del orphan_metas[og]
-                    break
+                # Take the first available orphan metadata
+                og = next(iter(orphan_metas), None)
+                if og is not None:
+                    meta = orphan_metas.pop(og)
 
             title = ""
             level = 0
@@ -397,17 +418,21 @@ class OneStoreParser:
                 level = _parse_int(meta.properties.get("PageLevel", 0))
                 creation = str(meta.properties.get("TopologyCreationTimeStamp", ""))
 
-            # Extract author from the page node
-            author = ""
-            last_modified = ""
-            for o in objs:
-                if o.obj_type == _PAGE_NODE:
-                    author = _clean_text(str(o.properties.get("Author", "")))
-                    last_modified = str(o.properties.get("LastModifiedTime", ""))
-                    break
+            # Content objects for this GUID only (pre-filtered above)
+            content = guid_content.get(content_guid, [])
 
-            # Collect content objects for this GUID only
-            content = [o for o in objs if o.obj_type in _CONTENT_TYPES]
+            # Deduplicate by title — keep the version with more content.
+            # Untitled pages are distinct pages, never duplicates.  The
+            # comparison happens before building the page so losing
+            # revisions are skipped without allocating anything.
+            key = title.lower()
+            idx = seen_titles.get(key) if key else None
+            if idx is not None and len(content) <= len(pages[idx].objects):
+                continue
+
+            # Extract author from the page node
+            author = _clean_text(str(pn.properties.get("Author", "")))
+            last_modified = str(pn.properties.get("LastModifiedTime", ""))
 
             page = ExtractedPage(
                 title=title or "Untitled",
@@ -418,14 +443,11 @@ class OneStoreParser:
                 objects=content,
             )
 
-            # Deduplicate by title — keep the version with more content
-            key = title.lower().strip()
-            if key in seen_titles:
-                idx = seen_titles[key]
-                if len(content) > len(pages[idx].objects):
-                    pages[idx] = page
+            if idx is not None:
+                pages[idx] = page
             else:
-                seen_titles[key] = len(pages)
+                if key:
+                    seen_titles[key] = len(pages)
                 pages.append(page)
 
         return pages
@@ -437,16 +459,18 @@ def _extract_guid(identity_str: str) -> str:
     Input format: '<ExtendedGUID> (guid-string, n)'
     Returns just the guid-string part.
     """
-    match = re.search(r"\(([^,]+),", identity_str)
-    if match:
-        return match.group(1).strip()
-    return ""
+    _, sep, rest = identity_str.partition("(")
+    if not sep:
+        return ""
+    guid, sep, _ = rest.partition(",")
+    return guid.strip() if sep else ""
 
 
 def _clean_text(text: str) -> str:
     """Clean up text by stripping null bytes and extra whitespace."""
-    text = text.replace("\x00", "").strip()
-    return text
+    if "\x00" in text:
+        text = text.translate(_NULL_TRANS)
+    return text.strip()
 
 
 def _parse_int(value: object) -> int:
@@ -454,13 +478,13 @@ def _parse_int(value: object) -> int:
     if isinstance(value, int):
         return value
     if isinstance(value, bytes):
-        try:
-            return int.from_bytes(value[:4], "little")
-        except Exception:
-            return 0
+        return int.from_bytes(value[:4], "little")
     if isinstance(value, str):
-        # Try to extract numeric value
-        match = re.search(r"\d+", value)
+        # Pure digit strings are the common case; only fall back to the
+        # regex to pull a number out of surrounding text.
+        if value.isdecimal():
+            return int(value)
+        match = _DIGIT_RE.search(value)
         if match:
             return int(match.group())
     return 0
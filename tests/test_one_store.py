@@ -4,6 +4,7 @@ from onenote_export.parser.one_store import (
     ExtractedObject,
     ExtractedPage,
     ExtractedSection,
+    OneStoreParser,
     _clean_text,
     _extract_guid,
     _parse_int,
@@ -30,6 +31,9 @@ class TestExtractGuid:
     def test_missing_comma(self):
         assert _extract_guid("(no-comma)") == ""
 
+    def test_empty_guid_before_comma(self):
+        assert _extract_guid("<ExtendedGUID> (, 7)") == ""
+
     def test_complex_guid(self):
         identity = "<ExtendedGUID> ({12345678-abcd-ef01-2345-6789abcdef01}, 138)"
         assert _extract_guid(identity) == "{12345678-abcd-ef01-2345-6789abcdef01}"
@@ -74,6 +78,12 @@ class TestParseInt:
     def test_string_with_number(self):
         assert _parse_int("level: 3") == 3
 
+    def test_numeric_string(self):
+        assert _parse_int("12") == 12
+
+    def test_string_with_sign_ignores_sign(self):
+        assert _parse_int("-3") == 3
+
     def test_string_no_number(self):
         assert _parse_int("none") == 0
 
@@ -133,3 +143,83 @@ class TestExtractedDataclasses:
         assert section.file_path == "/test.one"
         assert section.display_name == "Test Section"
         assert len(section.pages) == 1
+
+
+def _obj(obj_type: str, guid: str, n: int = 1, **props) -> ExtractedObject:
+    return ExtractedObject(
+        obj_type=obj_type,
+        identity=f"<ExtendedGUID> ({guid}, {n})",
+        properties=props,
+    )
+
+
+class TestBuildPages:
+    """Tests for OneStoreParser._build_pages."""
+
+    def _build(self, objects):
+        return OneStoreParser("unused.one")._build_pages(objects)
+
+    def test_no_metadata_single_page(self):
+        objects = [
+            _obj("jcidRichTextOENode", "a"),
+            _obj("jcidSectionNode", "s"),
+            _obj("jcidImageNode", "b"),
+        ]
+        pages = self._build(objects)
+        assert len(pages) == 1
+        assert [o.obj_type for o in pages[0].objects] == [
+            "jcidRichTextOENode",
+            "jcidImageNode",
+        ]
+
+    def test_page_per_content_guid(self):
+        objects = [
+            _obj("jcidPageMetaData", "p1", CachedTitleString="First"),
+            _obj("jcidPageNode", "p1", Author="Alice"),
+            _obj("jcidRichTextOENode", "p1"),
+            _obj("jcidPageMetaData", "p2", CachedTitleString="Second"),
+            _obj("jcidPageNode", "p2"),
+            _obj("jcidRichTextOENode", "p2"),
+            _obj("jcidRichTextOENode", "p2", 2),
+        ]
+        pages = self._build(objects)
+        assert [p.title for p in pages] == ["First", "Second"]
+        assert pages[0].author == "Alice"
+        assert len(pages[1].objects) == 2
+
+    def test_duplicate_titles_keep_larger(self):
+        objects = [
+            _obj("jcidPageMetaData", "p1", CachedTitleString="Notes"),
+            _obj("jcidPageNode", "p1"),
+            _obj("jcidRichTextOENode", "p1"),
+            _obj("jcidPageMetaData", "p2", CachedTitleString="notes"),
+            _obj("jcidPageNode", "p2"),
+            _obj("jcidRichTextOENode", "p2"),
+            _obj("jcidRichTextOENode", "p2", 2),
+        ]
+        pages = self._build(objects)
+        assert len(pages) == 1
+        assert pages[0].title == "notes"
+        assert len(pages[0].objects) == 2
+
+    def test_untitled_pages_not_merged(self):
+        objects = [
+            _obj("jcidPageMetaData", "p1"),
+            _obj("jcidPageNode", "p1"),
+            _obj("jcidRichTextOENode", "p1"),
+            _obj("jcidPageMetaData", "p2"),
+            _obj("jcidPageNode", "p2"),
+            _obj("jcidRichTextOENode", "p2"),
+        ]
+        pages = self._build(objects)
+        assert [p.title for p in pages] == ["Untitled", "Untitled"]
+
+    def test_orphan_metadata_fallback(self):
+        objects = [
+            _obj("jcidPageMetaData", "old", CachedTitleString="Orphan"),
+            _obj("jcidPageNode", "p1"),
+            _obj("jcidRichTextOENode", "p1"),
+        ]
+        pages = self._build(objects)
+        assert len(pages) == 1
+        assert pages[0].title == "Orphan"